@@ -1,5 +1,7 @@
 mod emoji_data;
 
+use aho_corasick::AhoCorasick;
+pub use aho_corasick::BuildError;
 use once_cell::sync::Lazy;
 use regex::Regex;
 use std::cmp::Ordering;
@@ -128,17 +130,45 @@ impl Segmentation {
     }
 }
 
-/// Stateless segmenter wrapper that mirrors the Python extension behaviour.
-#[derive(Clone, Copy, Default)]
-pub struct Segmenter;
+/// Segmenter that mirrors the Python extension behaviour.
+///
+/// The default segmenter is stateless and bunkai-compatible. Segmenters built with
+/// [`Segmenter::with_exceptions`] additionally keep sentences together across
+/// user-supplied abbreviations such as `Mr.` or `e.g.`.
+#[derive(Clone, Default)]
+pub struct Segmenter {
+    exceptions: Option<AhoCorasick>,
+}
 
 impl Segmenter {
     pub fn new() -> Self {
-        Self
+        Self::default()
+    }
+
+    /// Builds a segmenter that never splits inside any of the given abbreviations.
+    ///
+    /// Patterns are matched case-sensitively and must start at a word boundary. An
+    /// empty list yields the default segmenter.
+    pub fn with_exceptions<I, P>(exceptions: I) -> Result<Self, BuildError>
+    where
+        I: IntoIterator<Item = P>,
+        P: AsRef<str>,
+    {
+        let patterns: Vec<String> = exceptions
+            .into_iter()
+            .map(|pattern| pattern.as_ref().to_string())
+            .filter(|pattern| !pattern.is_empty())
+            .collect();
+        if patterns.is_empty() {
+            return Ok(Self::default());
+        }
+        Ok(Self {
+            exceptions: Some(AhoCorasick::new(patterns)?),
+        })
     }
 
     pub fn segment(&self, text: &str) -> Segmentation {
-        segment_impl(text).into()
+        segment_impl(text, self.exceptions.as_ref()).into()
     }
 }
 
@@ -484,7 +514,7 @@ fn find_emotion_expressions(view: &TextView<'_>) -> Vec<SpanRecord> {
     unify_span_annotations(spans)
 }
 
-fn segment_impl(text: &str) -> PipelineOutput {
+fn segment_impl(text: &str, exceptions: Option<&AhoCorasick>) -> PipelineOutput {
     let view = TextView::new(text);
     let mut state = PipelineState::new(view.char_len());
 
@@ -504,6 +534,9 @@ fn segment_impl(text: &str) -> PipelineOutput {
     apply_indirect_quote(&view, &mut state);
     apply_dot_exception(&view, &mut state);
     apply_number_exception(&view, &mut state);
+    if let Some(automaton) = exceptions {
+        apply_user_exception(&view, &mut state, automaton);
+    }
     apply_linebreak_force(&view, &mut state);
 
     state.into_output()
@@ -796,6 +829,33 @@ fn is_exception_no(view: &TextView<'_>, span: &SpanRecord) -> bool {
     next_char.is_ascii_digit()
 }
 
+fn apply_user_exception(view: &TextView<'_>, state: &mut PipelineState, automaton: &AhoCorasick) {
+    let mut covered: Vec<bool> = Vec::new();
+    for mat in automaton.find_overlapping_iter(view.text()) {
+        let start = view.byte_to_char_index(mat.start());
+        if start > 0
+            && view
+                .char_at(start - 1)
+                .is_some_and(|ch| ch.is_ascii_alphanumeric())
+        {
+            continue;
+        }
+        if covered.is_empty() {
+            covered.resize(view.char_len(), false);
+        }
+        let end = view.byte_to_char_index(mat.end());
+        covered[start..end].fill(true);
+    }
+
+    let filtered: Vec<SpanRecord> = state
+        .final_spans()
+        .iter()
+        .filter(|span| !covered.get(span.start).copied().unwrap_or(false))
+        .cloned()
+        .collect();
+    state.add_layer("UserExceptionAnnotator", filtered);
+}
+
 fn apply_linebreak_force(view: &TextView<'_>, state: &mut PipelineState) {
     let mut map: HashMap<usize, (usize, usize)> = HashMap::new();
     for mat in LINEBREAK_REGEX.find_iter(view.text()) {
@@ -890,4 +950,47 @@ mod tests {
         let output = Segmenter::new().segment(text);
         assert_eq!(output.final_boundaries, vec![12]);
     }
+
+    #[test]
+    fn user_exceptions_keep_abbreviations_together() {
+        let text = "Mr. Smith met Dr. Who in the U.S. today. See Fig. 3 e.g. here.";
+        let default_output = Segmenter::new().segment(text);
+        assert!(default_output.final_boundaries.len() > 2);
+
+        let segmenter = Segmenter::with_exceptions(["Mr.", "Dr.", "U.S.", "Fig.", "e.g."]).unwrap();
+        let output = segmenter.segment(text);
+        assert_eq!(output.final_boundaries, vec![41, text.chars().count()]);
+        assert_eq!(
+            output.layers.last().map(|layer| layer.name),
+            Some("LinebreakForceAnnotator")
+        );
+        assert!(output
+            .layers
+            .iter()
+            .any(|layer| layer.name == "UserExceptionAnnotator"));
+    }
+
+    #[test]
+    fn user_exceptions_require_word_boundary() {
+        let text = "Hmr. Next sentence.";
+        let segmenter = Segmenter::with_exceptions(["mr."]).unwrap();
+        let output = segmenter.segment(text);
+        assert_eq!(
+            output.final_boundaries,
+            Segmenter::new().segment(text).final_boundaries
+        );
+    }
+
+    #[test]
+    fn empty_exception_list_matches_default_pipeline() {
+        let text = "Mr. Smith went home. 本日は晴天なり。";
+        let segmenter = Segmenter::with_exceptions(Vec::<String>::new()).unwrap();
+        let output = segmenter.segment(text);
+        let default_output = Segmenter::new().segment(text);
+        assert_eq!(output.final_boundaries, default_output.final_boundaries);
+        assert!(output
+            .layers
+            .iter()
+            .all(|layer| layer.name != "UserExceptionAnnotator"));
+    }
 }
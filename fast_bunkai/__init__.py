@@ -1,5 +1,17 @@
 """FastBunkai public API."""
 
-from .core import FastBunkai, FastBunkaiSentenceBoundaryDisambiguation
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .core import FastBunkai, FastBunkaiSentenceBoundaryDisambiguation
 
 __all__ = ["FastBunkai", "FastBunkaiSentenceBoundaryDisambiguation"]
+
+
+def __getattr__(name: str) -> Any:
+    # Resolved on first use so that `fast-bunkai --connect` never imports Janome.
+    if name in __all__:
+        from . import core
+
+        return getattr(core, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
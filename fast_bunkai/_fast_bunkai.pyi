@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import List, TypedDict
+from typing import List, Sequence, TypedDict
 
 class SpanDict(TypedDict):
     rule_name: str
@@ -18,3 +18,7 @@ class SegmentResult(TypedDict):
     final_boundaries: List[int]
 
 def segment(text: str) -> SegmentResult: ...
+
+class Segmenter:
+    def __init__(self, exceptions: Sequence[str] = ...) -> None: ...
+    def segment(self, text: str) -> SegmentResult: ...
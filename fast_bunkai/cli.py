@@ -1,27 +1,34 @@
 from __future__ import annotations
 
 import argparse
+import socket
 import sys
-from importlib import metadata
 from pathlib import Path
-from typing import Iterator
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional
 
-from fast_bunkai import FastBunkai
+if TYPE_CHECKING:
+    from fast_bunkai.core import FastBunkai
 
 METACHAR_SENTENCE_BOUNDARY = "│"
 METACHAR_LINE_BREAK = "▁"
 
 
 def _version() -> str:
+    from importlib import metadata
+
     try:
         return metadata.version("fast-bunkai")
     except metadata.PackageNotFoundError:
         return "unknown"
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Sentence boundary detection compatible with bunkai CLI",
+        epilog=(
+            "Run `fast-bunkai serve --help` for the resident server mode and "
+            "`fast-bunkai corpus --help` for parallel corpus processing."
+        ),
     )
     parser.add_argument(
         "--input",
@@ -42,13 +49,97 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Print morphological analysis result like bunkai --ma",
     )
+    parser.add_argument(
+        "--connect",
+        type=Path,
+        default=None,
+        metavar="SOCKET",
+        help="Send input to a running `fast-bunkai serve` process instead of segmenting locally",
+    )
     parser.add_argument(
         "--version",
         "-v",
         action="store_true",
         help="Print version information",
     )
-    return parser.parse_args()
+    return parser.parse_args(argv)
+
+
+def parse_serve_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="fast-bunkai serve",
+        description="Keep a warm segmenter resident and answer JSONL requests on a Unix socket",
+    )
+    parser.add_argument(
+        "--socket",
+        "-s",
+        type=Path,
+        required=True,
+        help="Unix domain socket path to listen on",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help=(
+            "Number of threads segmenting requests (default: cpu_count + 4, max 32); "
+            "connections themselves are not limited"
+        ),
+    )
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=300.0,
+        metavar="SECONDS",
+        help="Close connections idle for this long (default: 300, 0 disables)",
+    )
+    return parser.parse_args(argv)
+
+
+def parse_corpus_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="fast-bunkai corpus",
+        description=(
+            "Segment directories or globs of .txt/.jsonl(.gz) files across a process pool "
+            "into resumable output shards"
+        ),
+    )
+    parser.add_argument(
+        "inputs",
+        nargs="+",
+        help="Input files, directories (searched recursively) or glob patterns",
+    )
+    parser.add_argument(
+        "--output-dir",
+        "-o",
+        type=Path,
+        required=True,
+        help="Directory receiving the shards and the resume manifest",
+    )
+    parser.add_argument(
+        "--ma",
+        action="store_true",
+        help="Write morphological analysis output like bunkai --ma",
+    )
+    parser.add_argument(
+        "--workers",
+        "-j",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: cpu_count)",
+    )
+    parser.add_argument(
+        "--docs-per-shard",
+        type=int,
+        default=10000,
+        help="Documents per output shard and checkpoint (default: 10000)",
+    )
+    parser.add_argument(
+        "--text-field",
+        default="text",
+        help="JSONL field holding the document text (default: text)",
+    )
+    return parser.parse_args(argv)
 
 
 def _open_reader(path: Path):
@@ -116,49 +207,116 @@ def _sentence_output(text: str, splitter: FastBunkai) -> Iterator[str]:
     yield "\n"
 
 
+def _warn_metachar() -> None:
+    sys.stderr.write(
+        "\033[91m[Warning] All │ characters will be removed from input to avoid ambiguity\n\033[0m"
+    )
+
+
+def _warn_once_on_metachar(lines: Iterable[str]) -> Iterator[str]:
+    warned = False
+    for line in lines:
+        if not warned and METACHAR_SENTENCE_BOUNDARY in line:
+            _warn_metachar()
+            warned = True
+        yield line
+
+
+def render_line(splitter: FastBunkai, line: str, ma: bool = False) -> Iterator[str]:
+    """Render one CLI input line as CLI output, silently dropping any ``│`` characters.
+
+    Shared by the CLI, ``fast-bunkai serve`` and ``fast-bunkai corpus`` so that all
+    three produce identical output.
+    """
+    raw = line[:-1] if line.endswith("\n") else line
+    text = raw.replace(METACHAR_SENTENCE_BOUNDARY, "").replace(METACHAR_LINE_BREAK, "\n")
+
+    if ma:
+        return _morph_output(text, splitter)
+    return _sentence_output(text, splitter)
+
+
 def _process_line(
     splitter: FastBunkai,
     line: str,
     ma: bool,
     warned: bool,
 ) -> tuple[bool, Iterator[str]]:
-    raw = line[:-1] if line.endswith("\n") else line
+    if not warned and METACHAR_SENTENCE_BOUNDARY in line:
+        _warn_metachar()
+        warned = True
+    return warned, render_line(splitter, line, ma)
 
-    if METACHAR_SENTENCE_BOUNDARY in raw:
-        raw = raw.replace(METACHAR_SENTENCE_BOUNDARY, "")
-        if not warned:
-            sys.stderr.write(
-                "\033[91m"
-                "[Warning] All │ characters will be removed from input to avoid ambiguity\n"
-                "\033[0m"
-            )
-            warned = True
 
-    text = raw.replace(METACHAR_LINE_BREAK, "\n")
+def _serve_main(argv: List[str]) -> None:
+    args = parse_serve_args(argv)
+    if not hasattr(socket, "AF_UNIX"):
+        sys.exit("fast-bunkai serve requires Unix domain socket support")
 
-    if ma:
-        return warned, _morph_output(text, splitter)
-    return warned, _sentence_output(text, splitter)
+    from fast_bunkai.server import serve
+
+    try:
+        serve(args.socket, workers=args.workers, idle_timeout=args.idle_timeout)
+    except FileExistsError as exc:
+        sys.exit(f"fast-bunkai serve: {exc}")
+
+
+def _corpus_main(argv: List[str]) -> None:
+    args = parse_corpus_args(argv)
+
+    from fast_bunkai.corpus import discover_inputs, process_corpus
+
+    inputs = discover_inputs(args.inputs)
+    if not inputs:
+        sys.exit("fast-bunkai corpus: no input files matched")
+    try:
+        process_corpus(
+            inputs,
+            args.output_dir,
+            ma=args.ma,
+            workers=args.workers,
+            docs_per_shard=args.docs_per_shard,
+            text_field=args.text_field,
+        )
+    except ValueError as exc:
+        sys.exit(f"fast-bunkai corpus: {exc}")
 
 
 def main() -> None:
-    args = parse_args()
+    argv = sys.argv[1:]
+    if argv[:1] == ["serve"]:
+        _serve_main(argv[1:])
+        return
+    if argv[:1] == ["corpus"]:
+        _corpus_main(argv[1:])
+        return
+
+    args = parse_args(argv)
 
     if args.version:
         print(f"fast-bunkai {_version()}")
         return
 
-    splitter = FastBunkai()
-    warned = False
-
     reader_obj = _open_reader(args.input)
     writer_obj = _open_writer(args.output)
 
     try:
-        for line in reader_obj:
-            warned, iterator = _process_line(splitter, line, args.ma, warned)
-            for chunk in iterator:
-                writer_obj.write(chunk)
+        if args.connect is not None:
+            # The client must not import the segmenter: that is what the server saves.
+            from fast_bunkai.client import request_lines
+
+            lines = _warn_once_on_metachar(reader_obj)
+            for output in request_lines(args.connect, lines, args.ma):
+                writer_obj.write(output)
+        else:
+            from fast_bunkai.core import FastBunkai
+
+            splitter = FastBunkai()
+            warned = False
+            for line in reader_obj:
+                warned, iterator = _process_line(splitter, line, args.ma, warned)
+                for chunk in iterator:
+                    writer_obj.write(chunk)
     finally:
         if reader_obj is not sys.stdin:
             reader_obj.close()
@@ -0,0 +1,62 @@
+"""Client for ``fast-bunkai serve``.
+
+This module deliberately imports nothing beyond the standard library's socket and
+JSON support, so that ``fast-bunkai --connect`` starts without loading Janome or
+the native extension.
+"""
+
+from __future__ import annotations
+
+import json
+import socket
+import threading
+from pathlib import Path
+from typing import Iterable, Iterator, List
+
+
+def request_lines(socket_path: Path, lines: Iterable[str], ma: bool = False) -> Iterator[str]:
+    """Send ``lines`` to a running server and yield the rendered outputs in order.
+
+    Requests are written from a background thread so that they are pipelined
+    while responses are read back.
+    """
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    conn.connect(str(socket_path))
+    send_error: List[BaseException] = []
+    sent = 0
+
+    def send() -> None:
+        nonlocal sent
+        try:
+            for line in lines:
+                payload = {"text": line, "ma": ma}
+                conn.sendall(json.dumps(payload, ensure_ascii=False).encode("utf-8") + b"\n")
+                sent += 1
+            conn.shutdown(socket.SHUT_WR)
+        except BaseException as exc:  # surfaced to the reader below
+            send_error.append(exc)
+            try:
+                conn.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    sender = threading.Thread(target=send, name="fast-bunkai-client", daemon=True)
+    sender.start()
+    received = 0
+    try:
+        with conn.makefile("rb") as reader:
+            for raw in reader:
+                response = json.loads(raw)
+                if "error" in response:
+                    raise RuntimeError(f"fast-bunkai server error: {response['error']}")
+                received += 1
+                yield response["output"]
+        sender.join()
+        if send_error:
+            raise send_error[0]
+        if received < sent:
+            raise ConnectionError(
+                f"fast-bunkai server closed the connection after {received} of {sent} responses"
+            )
+    finally:
+        conn.close()
@@ -2,7 +2,19 @@ from __future__ import annotations
 
 import threading
 import warnings
-from typing import TYPE_CHECKING, Any, Iterator, List, Sequence, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    cast,
+)
 
 if TYPE_CHECKING:
     from ._fast_bunkai import SegmentResult
@@ -17,12 +29,62 @@ def _char_len(text: str) -> int:
     return len(text)
 
 
+def _annotations_from_result(
+    result: "SegmentResult",
+    morph_layer: Optional[Callable[[], List[SpanAnnotation]]] = None,
+) -> Annotations:
+    annotations = Annotations()
+
+    for layer in result["layers"]:
+        spans = [
+            SpanAnnotation(
+                rule_name=span["rule_name"],
+                start_index=span["start"],
+                end_index=span["end"],
+                split_string_type=span["split_type"],
+                split_string_value=span["split_value"],
+                args=None,
+            )
+            for span in layer["spans"]
+        ]
+        annotations.add_annotation_layer(layer["name"], spans)
+        if layer["name"] == "BasicRule" and morph_layer is not None:
+            combined: List[SpanAnnotation] = morph_layer() + list(annotations.flatten())
+            annotations.add_annotation_layer("MorphAnnotatorJanome", combined)
+
+    return annotations
+
+
+def _build_native_segmenter(exceptions: Tuple[str, ...]) -> Optional[_fast_bunkai.Segmenter]:
+    for pattern in exceptions:
+        if not isinstance(pattern, str):
+            raise TypeError(f"exceptions must be strings, got {type(pattern).__name__}")
+    if not any(exceptions):
+        # Keep the stateless, bunkai-compatible pipeline when no abbreviations are given.
+        return None
+    return _fast_bunkai.Segmenter(list(exceptions))
+
+
 class FastBunkaiSentenceBoundaryDisambiguation:
     _LARGE_TEXT_THRESHOLD_BYTES = 10 * 1024 * 1024
 
-    def __init__(self) -> None:
+    def __init__(self, exceptions: Optional[Iterable[str]] = None) -> None:
         self._tokenizer_factory = Tokenizer
         self._tokenizer_local = threading.local()
+        if isinstance(exceptions, str):
+            raise TypeError("exceptions must be an iterable of strings, not a single string")
+        self._exceptions = tuple(exceptions or ())
+        self._native = _build_native_segmenter(self._exceptions)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Thread-local tokenizers are not picklable; workers rebuild them lazily.
+        return {"tokenizer_factory": self._tokenizer_factory, "exceptions": self._exceptions}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self._tokenizer_factory = state["tokenizer_factory"]
+        self._tokenizer_local = threading.local()
+        self._exceptions = state.get("exceptions", ())
+        self._native = _build_native_segmenter(self._exceptions)
 
     def __call__(self, text: str) -> Iterator[str]:
         result = self._segment(text)
@@ -40,31 +102,18 @@ class FastBunkaiSentenceBoundaryDisambiguation:
 
     def eos(self, text: str) -> Annotations:
         result = self._segment(text)
-        annotations = Annotations()
+        return _annotations_from_result(result, lambda: self._build_morph_layer(text))
 
-        for layer in result["layers"]:
-            spans = [
-                SpanAnnotation(
-                    rule_name=span["rule_name"],
-                    start_index=span["start"],
-                    end_index=span["end"],
-                    split_string_type=span["split_type"],
-                    split_string_value=span["split_value"],
-                    args=None,
-                )
-                for span in layer["spans"]
-            ]
-            annotations.add_annotation_layer(layer["name"], spans)
-            if layer["name"] == "BasicRule":
-                morph_spans = self._build_morph_layer(text)
-                combined: List[SpanAnnotation] = morph_spans + list(annotations.flatten())
-                annotations.add_annotation_layer("MorphAnnotatorJanome", combined)
+    def segment_packed(self, text: str) -> bytes:
+        from .serialization import pack_segmentation
 
-        return annotations
+        return pack_segmentation(self._segment(text))
 
     def _segment(self, text: str) -> "SegmentResult":
         self._warn_large_text(text)
-        return _fast_bunkai.segment(text)
+        if self._native is None:
+            return _fast_bunkai.segment(text)
+        return self._native.segment(text)
 
     def _build_morph_layer(self, text: str) -> List[SpanAnnotation]:
         tokenizer = self._get_tokenizer()
@@ -128,6 +177,10 @@ class FastBunkaiSentenceBoundaryDisambiguation:
         )
 
     def _get_tokenizer(self) -> Tokenizer:
+        # Each thread owns a Tokenizer, and with it a private fst.Matcher: the Matcher's
+        # prefix cache is read and evicted outside its lock, which raises KeyError when
+        # threads share one without the GIL. Only the read-only system dictionary (and
+        # Janome's thread-safe lru_caches) are shared between threads.
         tokenizer = getattr(self._tokenizer_local, "instance", None)
         if tokenizer is None:
             tokenizer = self._tokenizer_factory()
@@ -0,0 +1,309 @@
+"""Resumable, sharded corpus segmentation across a process pool.
+
+Inputs are plain text (one document per line, using the CLI placeholders), JSONL
+(one object per line with the document under ``text_field``), or gzip-compressed
+variants of either. Documents are read in chunks of ``docs_per_shard``; each chunk
+is decoded and segmented by a pool worker and written to its own shard in the CLI
+output format. A ``manifest.json`` in the output directory records finished shards,
+so rerunning the same command after an interruption only processes what is missing;
+finished chunks are skipped by counting raw lines, without parsing them. Files under
+the output directory are never treated as inputs.
+
+Manifest entries are keyed by each input's path relative to the deepest directory
+containing all inputs, so the corpus may be moved or remounted between runs. The
+manifest also pins the set of inputs and each input's size and modification time; a
+resume with added, missing or modified inputs is rejected rather than mixing shards
+from different corpora.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import glob
+import gzip
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List, Optional, Sequence, Set, TextIO, Tuple, cast
+
+from .cli import METACHAR_LINE_BREAK, render_line
+from .core import FastBunkai
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 3
+INPUT_SUFFIXES = (".txt", ".jsonl", ".txt.gz", ".jsonl.gz")
+
+_RawLine = Tuple[int, bytes]
+
+
+@dataclasses.dataclass
+class CorpusStats:
+    shards: int = 0
+    documents: int = 0
+    bytes: int = 0
+    seconds: float = 0.0
+
+    @property
+    def docs_per_second(self) -> float:
+        return self.documents / self.seconds if self.seconds else 0.0
+
+    @property
+    def mb_per_second(self) -> float:
+        return self.bytes / (1024 * 1024) / self.seconds if self.seconds else 0.0
+
+
+def discover_inputs(patterns: Sequence[str]) -> List[Path]:
+    """Expand files, directories (searched recursively) and glob patterns into input paths."""
+    found: Dict[Path, None] = {}
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            candidates = [p for p in path.rglob("*") if p.is_file() and _is_input(p)]
+        elif path.is_file():
+            candidates = [path]
+        else:
+            candidates = [Path(p) for p in glob.glob(pattern, recursive=True) if Path(p).is_file()]
+        for candidate in sorted(candidates):
+            found.setdefault(candidate.resolve(), None)
+    return list(found)
+
+
+def _is_input(path: Path) -> bool:
+    return path.name.endswith(INPUT_SUFFIXES)
+
+
+def _is_jsonl(path: Path) -> bool:
+    name = path.name[:-3] if path.name.endswith(".gz") else path.name
+    return name.endswith(".jsonl")
+
+
+def _open_input(path: Path) -> IO[bytes]:
+    if path.name.endswith(".gz"):
+        return cast(IO[bytes], gzip.open(path, "rb"))
+    return path.open("rb")
+
+
+def _iter_raw_lines(path: Path, jsonl: bool) -> Iterator[_RawLine]:
+    """Yield ``(lineno, line)`` for each document line; blank JSONL lines are skipped."""
+    with _open_input(path) as reader:
+        for lineno, line in enumerate(reader, start=1):
+            if jsonl and not line.strip():
+                continue
+            yield lineno, line
+
+
+def _decode_document(path: Path, lineno: int, line: bytes, jsonl: bool, text_field: str) -> str:
+    if not jsonl:
+        try:
+            text = line.decode("utf-8")
+        except UnicodeDecodeError as exc:
+            raise ValueError(f"{path}:{lineno}: invalid UTF-8: {exc}") from None
+        return text[:-2] + "\n" if text.endswith("\r\n") else text
+    try:
+        record = json.loads(line)
+    except ValueError as exc:
+        raise ValueError(f"{path}:{lineno}: invalid JSON: {exc}") from None
+    if not isinstance(record, dict):
+        raise ValueError(f"{path}:{lineno}: expected a JSON object, got {type(record).__name__}")
+    if text_field not in record:
+        raise ValueError(f"{path}:{lineno}: missing field {text_field!r}")
+    text = record[text_field]
+    if not isinstance(text, str):
+        raise ValueError(
+            f"{path}:{lineno}: field {text_field!r} must be a string, got {type(text).__name__}"
+        )
+    return text.replace("\n", METACHAR_LINE_BREAK) + "\n"
+
+
+def iter_documents(path: Path, text_field: str = "text") -> Iterator[str]:
+    """Yield documents from ``path`` as CLI input lines.
+
+    Raises :class:`ValueError` naming the file and line for undecodable input.
+    """
+    jsonl = _is_jsonl(path)
+    for lineno, line in _iter_raw_lines(path, jsonl):
+        yield _decode_document(path, lineno, line, jsonl, text_field)
+
+
+def _chunked(lines: Iterator[_RawLine], size: int) -> Iterator[List[_RawLine]]:
+    chunk: List[_RawLine] = []
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+_worker_splitter: Optional[FastBunkai] = None
+
+
+def _init_worker() -> None:
+    global _worker_splitter
+    _worker_splitter = FastBunkai()
+
+
+def _segment_shard(
+    shard_path: str,
+    source: Path,
+    lines: List[_RawLine],
+    text_field: str,
+    ma: bool,
+) -> Tuple[int, int]:
+    splitter = _worker_splitter if _worker_splitter is not None else FastBunkai()
+    jsonl = _is_jsonl(source)
+    documents = [
+        _decode_document(source, lineno, line, jsonl, text_field) for lineno, line in lines
+    ]
+    tmp_path = shard_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as writer:
+        for document in documents:
+            writer.writelines(render_line(splitter, document, ma))
+    os.replace(tmp_path, shard_path)
+    return len(documents), sum(len(line) for _, line in lines)
+
+
+def _input_root(inputs: Sequence[Path]) -> Path:
+    return Path(os.path.commonpath([str(path.parent) for path in inputs]))
+
+
+class _Manifest:
+    def __init__(self, output_dir: Path, settings: Dict[str, Any]) -> None:
+        self.path = output_dir / MANIFEST_NAME
+        self.settings = settings
+        self.inputs: Dict[str, Dict[str, Any]] = {}
+        if self.path.exists():
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("version") != MANIFEST_VERSION:
+                raise ValueError(f"unsupported manifest version in {self.path}")
+            if data.get("settings") != settings:
+                raise ValueError(
+                    f"{self.path} was written with settings {data.get('settings')}, "
+                    f"which differ from the requested {settings}; use a new output directory"
+                )
+            self.inputs = data["inputs"]
+
+    def register_inputs(self, inputs: Dict[str, Path]) -> None:
+        if self.inputs and set(self.inputs) != set(inputs):
+            added = sorted(set(inputs) - set(self.inputs))
+            missing = sorted(set(self.inputs) - set(inputs))
+            raise ValueError(
+                f"{self.path} was written for different inputs "
+                f"(added: {added[:3]}, missing: {missing[:3]}); use a new output directory"
+            )
+        for key, path in inputs.items():
+            info = path.stat()
+            entry = self.inputs.setdefault(
+                key,
+                {
+                    "index": len(self.inputs),
+                    "size": info.st_size,
+                    "mtime_ns": info.st_mtime_ns,
+                    "done": {},
+                },
+            )
+            if (entry["size"], entry["mtime_ns"]) != (info.st_size, info.st_mtime_ns):
+                raise ValueError(
+                    f"{path} changed since {self.path} was written; use a new output directory"
+                )
+
+    def file_index(self, key: str) -> int:
+        return self.inputs[key]["index"]
+
+    def done_chunks(self, key: str) -> Set[int]:
+        return {int(chunk) for chunk in self.inputs[key]["done"]}
+
+    def mark_done(self, key: str, chunk: int, documents: int, n_bytes: int) -> None:
+        self.inputs[key]["done"][str(chunk)] = {"documents": documents, "bytes": n_bytes}
+
+    def save(self) -> None:
+        payload = {"version": MANIFEST_VERSION, "settings": self.settings, "inputs": self.inputs}
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(json.dumps(payload, ensure_ascii=False, indent=1), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+
+def _report(stats: CorpusStats, stream: TextIO) -> None:
+    stream.write(
+        f"[fast-bunkai corpus] {stats.shards} shards, {stats.documents} docs, "
+        f"{stats.bytes / (1024 * 1024):.1f} MB in {stats.seconds:.1f}s "
+        f"({stats.docs_per_second:.1f} docs/s, {stats.mb_per_second:.2f} MB/s)\n"
+    )
+    stream.flush()
+
+
+def process_corpus(
+    inputs: Sequence[Path],
+    output_dir: Path,
+    *,
+    ma: bool = False,
+    workers: Optional[int] = None,
+    docs_per_shard: int = 10000,
+    text_field: str = "text",
+    progress: bool = True,
+) -> CorpusStats:
+    """Segment ``inputs`` into shards under ``output_dir``, resuming from its manifest.
+
+    Returns statistics for the work done in this run; shards already recorded in the
+    manifest are skipped and not counted. Malformed input raises :class:`ValueError`
+    naming the file and line.
+    """
+    if docs_per_shard < 1:
+        raise ValueError("docs_per_shard must be positive")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    manifest = _Manifest(
+        output_dir,
+        {"ma": ma, "docs_per_shard": docs_per_shard, "text_field": text_field},
+    )
+    # Never read back our own shards, e.g. for `fast-bunkai corpus data -o data/out`.
+    excluded = output_dir.resolve()
+    inputs = [path for path in map(Path.resolve, inputs) if not path.is_relative_to(excluded)]
+    root = _input_root(inputs) if inputs else Path()
+    keys = {path.relative_to(root).as_posix(): path for path in inputs}
+    manifest.register_inputs(keys)
+    manifest.save()
+    max_workers = workers or os.cpu_count() or 1
+    stats = CorpusStats()
+    started = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as executor:
+        pending: Dict[Future[Tuple[int, int]], Tuple[str, int]] = {}
+
+        def drain(limit: int) -> None:
+            while len(pending) > limit:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    key, chunk = pending.pop(future)
+                    documents, n_bytes = future.result()
+                    manifest.mark_done(key, chunk, documents, n_bytes)
+                    stats.shards += 1
+                    stats.documents += documents
+                    stats.bytes += n_bytes
+                manifest.save()
+                stats.seconds = time.perf_counter() - started
+                if progress:
+                    _report(stats, sys.stderr)
+
+        for key, path in keys.items():
+            file_index = manifest.file_index(key)
+            done = manifest.done_chunks(key)
+            raw_lines = _iter_raw_lines(path, _is_jsonl(path))
+            for chunk, lines in enumerate(_chunked(raw_lines, docs_per_shard)):
+                if chunk in done:
+                    continue
+                shard_path = output_dir / f"shard-{file_index:05d}-{chunk:05d}.txt"
+                future = executor.submit(
+                    _segment_shard, str(shard_path), path, lines, text_field, ma
+                )
+                pending[future] = (key, chunk)
+                # Bound the number of in-flight chunks to keep parent memory flat.
+                drain(2 * max_workers)
+        drain(0)
+        manifest.save()
+
+    stats.seconds = time.perf_counter() - started
+    return stats
@@ -0,0 +1,143 @@
+"""Compact binary serialization of segmentation results.
+
+The packed form stores only integers, so it is far smaller and faster to move
+between processes than pickled :class:`~fast_bunkai.annotations.Annotations`.
+Layout (little-endian ``uint32`` throughout)::
+
+    header      magic "FBK1", n_layers, n_spans, n_boundaries
+    layers      n_layers  x (layer_rule_id, span_count)
+    spans       n_spans   x (start, end, rule_id)
+    boundaries  n_boundaries x end
+
+Rule ids index :data:`RULES`. Every span except the ``first`` sentinel carries
+``text[start:end]`` as its split value, so decoding takes the original text to
+restore it. The Janome ``MorphAnnotatorJanome`` layer is not included.
+"""
+
+from __future__ import annotations
+
+import struct
+import sys
+from array import array
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from .annotations import Annotations
+from .core import _annotations_from_result
+
+if TYPE_CHECKING:
+    from ._fast_bunkai import LayerDict, SegmentResult, SpanDict
+
+MAGIC = b"FBK1"
+_HEADER = struct.Struct("<4sIII")
+
+# (rule or layer name, split type) in id order. Only ever append to this table.
+RULES: Tuple[Tuple[str, Optional[str]], ...] = (
+    ("first", None),
+    ("FaceMarkDetector", "facemark"),
+    ("EmotionExpressionAnnotator", "EmotionExpressionAnnotator"),
+    ("EmojiAnnotator", "EmojiAnnotator"),
+    ("BasicRule", "BasicRule"),
+    ("IndirectQuoteExceptionAnnotator", None),
+    ("DotExceptionAnnotator", None),
+    ("NumberExceptionAnnotator", None),
+    ("LinebreakForceAnnotator", "linebreak"),
+    ("UserExceptionAnnotator", None),
+)
+_RULE_IDS: Dict[str, int] = {name: idx for idx, (name, _) in enumerate(RULES)}
+
+
+def _uint32_array(values: List[int]) -> array:
+    packed = array("I", values)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed
+
+
+def _read_header(data: bytes) -> Tuple[int, int, int]:
+    if len(data) < _HEADER.size:
+        raise ValueError("truncated packed segmentation")
+    magic, n_layers, n_spans, n_boundaries = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("not a packed fast-bunkai segmentation")
+    return n_layers, n_spans, n_boundaries
+
+
+def _rule(rule_id: int) -> Tuple[str, Optional[str]]:
+    if rule_id >= len(RULES):
+        raise ValueError(f"unknown rule id {rule_id} in packed segmentation")
+    return RULES[rule_id]
+
+
+def _read_uint32(data: bytes, offset: int, count: int) -> Tuple[array, int]:
+    end = offset + 4 * count
+    if end > len(data):
+        raise ValueError("truncated packed segmentation")
+    values = array("I")
+    values.frombytes(data[offset:end])
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values, end
+
+
+def pack_segmentation(result: "SegmentResult") -> bytes:
+    layer_table: List[int] = []
+    spans: List[int] = []
+    try:
+        for layer in result["layers"]:
+            layer_table.extend((_RULE_IDS[layer["name"]], len(layer["spans"])))
+            for span in layer["spans"]:
+                spans.extend((span["start"], span["end"], _RULE_IDS[span["rule_name"]]))
+    except KeyError as exc:
+        raise ValueError(f"unknown rule name {exc.args[0]!r}") from None
+    boundaries = result["final_boundaries"]
+    header = _HEADER.pack(MAGIC, len(result["layers"]), len(spans) // 3, len(boundaries))
+    return b"".join(
+        (
+            header,
+            _uint32_array(layer_table).tobytes(),
+            _uint32_array(spans).tobytes(),
+            _uint32_array(boundaries).tobytes(),
+        )
+    )
+
+
+def unpack_segmentation(data: bytes, text: str) -> "SegmentResult":
+    n_layers, n_spans, n_boundaries = _read_header(data)
+    layer_table, offset = _read_uint32(data, _HEADER.size, 2 * n_layers)
+    spans, offset = _read_uint32(data, offset, 3 * n_spans)
+    boundaries, _ = _read_uint32(data, offset, n_boundaries)
+
+    layers: List["LayerDict"] = []
+    cursor = 0
+    for layer_idx in range(n_layers):
+        layer_rule, span_count = layer_table[2 * layer_idx], layer_table[2 * layer_idx + 1]
+        if cursor + span_count > n_spans:
+            raise ValueError("layer span counts exceed the packed span table")
+        layer_spans: List["SpanDict"] = []
+        for base in range(3 * cursor, 3 * (cursor + span_count), 3):
+            start, end, rule_id = spans[base], spans[base + 1], spans[base + 2]
+            rule_name, split_type = _rule(rule_id)
+            layer_spans.append(
+                {
+                    "rule_name": rule_name,
+                    "start": start,
+                    "end": end,
+                    "split_type": split_type,
+                    "split_value": None if rule_id == 0 else text[start:end],
+                }
+            )
+        cursor += span_count
+        layers.append({"name": _rule(layer_rule)[0], "spans": layer_spans})
+
+    return {"layers": layers, "final_boundaries": boundaries.tolist()}
+
+
+def unpack_annotations(data: bytes, text: str) -> Annotations:
+    return _annotations_from_result(unpack_segmentation(data, text))
+
+
+def unpack_boundaries(data: bytes) -> List[int]:
+    n_layers, n_spans, n_boundaries = _read_header(data)
+    offset = _HEADER.size + 4 * (2 * n_layers + 3 * n_spans)
+    boundaries, _ = _read_uint32(data, offset, n_boundaries)
+    return boundaries.tolist()
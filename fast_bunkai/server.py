@@ -0,0 +1,207 @@
+"""Resident segmentation server speaking JSONL over a Unix domain socket.
+
+Each request is one JSON object per line, ``{"text": <line>, "ma": <bool>}``, where
+``text`` uses the same placeholders as the CLI input. Each response is one JSON
+object per line, ``{"output": <rendered CLI output>}`` or ``{"error": <message>}``,
+written in request order. Clients may pipeline any number of requests on a
+connection: each request is handed to a fixed pool of worker threads, which keep
+their Janome tokenizers warm, as soon as it is read, so one connection can keep
+every worker busy. Every connection gets its own lightweight reader and writer
+threads, so idle clients never block new ones. Connections idle for longer than
+``idle_timeout`` seconds are closed, and shutting the server down closes any that
+remain.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import queue
+import signal
+import socket
+import socketserver
+import stat
+import threading
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Optional, Set, cast
+
+from .cli import render_line
+from .core import FastBunkai
+
+DEFAULT_IDLE_TIMEOUT = 300.0
+_WARMUP_TEXT = "ウォームアップ。Warm up the server.\n"
+
+
+class _SegmentationHandler(socketserver.StreamRequestHandler):
+    def setup(self) -> None:
+        super().setup()
+        self.connection.settimeout(cast(SegmentationServer, self.server).idle_timeout)
+
+    def handle(self) -> None:
+        server = cast(SegmentationServer, self.server)
+        # Requests are submitted as soon as they are read and a writer thread returns the
+        # responses in order. The bounded queue holds back clients that pipeline faster
+        # than the workers can keep up.
+        pending: queue.Queue[Optional[Future[Dict[str, Any]]]] = queue.Queue(server.pipeline_depth)
+        writer = threading.Thread(
+            target=self._write_responses,
+            args=(pending,),
+            name="fast-bunkai-serve-writer",
+            daemon=True,
+        )
+        writer.start()
+        try:
+            for raw in self.rfile:
+                if raw.strip():
+                    pending.put(server.submit(raw))
+        except (TimeoutError, ConnectionError):
+            # Idle client, client gone, or server shutting down: stop reading.
+            pass
+        finally:
+            pending.put(None)
+            writer.join()
+
+    def _write_responses(self, pending: queue.Queue[Optional[Future[Dict[str, Any]]]]) -> None:
+        failed = False
+        while True:
+            future = pending.get()
+            if future is None:
+                return
+            if failed:
+                # Keep draining so the reader never blocks on a full queue.
+                future.cancel()
+                continue
+            try:
+                response = future.result()
+            except CancelledError:
+                failed = True
+                self._abort()
+                continue
+            except Exception as exc:
+                response = {"error": f"segmentation failed: {exc}"}
+            try:
+                self.wfile.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+            except OSError:
+                failed = True
+                self._abort()
+
+    def _abort(self) -> None:
+        # Wake the reader so that the connection is torn down.
+        try:
+            self.connection.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+
+class SegmentationServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix socket server that keeps a warm :class:`FastBunkai` for all connections."""
+
+    daemon_threads = True
+    block_on_close = False
+
+    def __init__(
+        self,
+        socket_path: Path,
+        workers: Optional[int] = None,
+        idle_timeout: Optional[float] = DEFAULT_IDLE_TIMEOUT,
+    ) -> None:
+        _remove_stale_socket(socket_path)
+        self.socket_path = socket_path
+        self.idle_timeout = idle_timeout or None
+        self.splitter = FastBunkai()
+        max_workers = workers or min(32, (os.cpu_count() or 1) + 4)
+        self.pipeline_depth = 2 * max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="fast-bunkai-serve",
+        )
+        self._connections: Set[socket.socket] = set()
+        self._connections_lock = threading.Lock()
+        self._warm_up()
+        super().__init__(str(socket_path), _SegmentationHandler)
+
+    def submit(self, raw: bytes) -> Future[Dict[str, Any]]:
+        try:
+            return self._executor.submit(self.handle_payload, raw)
+        except RuntimeError:  # the executor refuses new work once shut down
+            raise ConnectionAbortedError("server is shutting down") from None
+
+    def handle_payload(self, raw: bytes) -> Dict[str, Any]:
+        try:
+            request = json.loads(raw)
+            text = request["text"]
+            ma = bool(request.get("ma", False))
+            if not isinstance(text, str):
+                raise TypeError("'text' must be a string")
+        except (ValueError, KeyError, TypeError, AttributeError) as exc:
+            return {"error": f"invalid request: {exc}"}
+        # The client reports the metachar warning itself, so keep the server quiet.
+        return {"output": "".join(render_line(self.splitter, text, ma))}
+
+    def process_request_thread(self, request: Any, client_address: Any) -> None:
+        with self._connections_lock:
+            self._connections.add(request)
+        try:
+            super().process_request_thread(request, client_address)
+        finally:
+            with self._connections_lock:
+                self._connections.discard(request)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        with self._connections_lock:
+            connections = list(self._connections)
+        for connection in connections:
+            # Wake handlers blocked on reads so their threads exit promptly.
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        try:
+            self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def _warm_up(self) -> None:
+        # Compile the Rust-side lazy tables and load the Janome dictionary up front.
+        list(self.splitter(_WARMUP_TEXT))
+        self.splitter.eos(_WARMUP_TEXT)
+
+
+def _remove_stale_socket(path: Path) -> None:
+    try:
+        mode = path.stat().st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(f"{path} exists and is not a socket")
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(str(path))
+    except (ConnectionRefusedError, FileNotFoundError):
+        path.unlink()
+        return
+    finally:
+        probe.close()
+    raise FileExistsError(f"another server is already listening on {path}")
+
+
+def _exit_on_signal(signum: int, frame: Any) -> None:
+    raise SystemExit(0)
+
+
+def serve(
+    socket_path: Path,
+    workers: Optional[int] = None,
+    idle_timeout: Optional[float] = DEFAULT_IDLE_TIMEOUT,
+) -> None:
+    """Serve segmentation requests on ``socket_path`` until interrupted or terminated."""
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, _exit_on_signal)
+    with SegmentationServer(socket_path, workers, idle_timeout) as server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, List
+
+from fast_bunkai import FastBunkai
+
+PASSAGES = [
+    (
+        "本日は晴天なり。スタッフ? と話し込み。合宿免許? の若者さん達でしょうか。"
+        "価格は3.5万円です。顔文字(*^_^*)だよ。おすすめ度No.1のホテルです。"
+        "メールはtest@example.comです。やったー(嬉)！わーい…！"
+        "スタッフ? と話し込み\n次の行でも議論は続いた。\n"
+    ),
+    (
+        "This paragraph exists solely to benchmark FastBunkai. Room No.411 was assigned."
+        ' The guide said, "Staff? kept talking." The mailing list is hello@example.org.'
+        " Later on, they climbed down the staircase and paused for a break.\n"
+    ),
+]
+
+
+def load_external_texts() -> List[str]:
+    data_dir = Path(__file__).resolve().parents[1] / "tests" / "data" / "texts"
+    if not data_dir.is_dir():
+        return []
+    return [path.read_text(encoding="utf-8") for path in sorted(data_dir.glob("*.txt"))]
+
+
+def gil_enabled() -> bool:
+    checker = getattr(sys, "_is_gil_enabled", None)
+    return True if checker is None else bool(checker())
+
+
+def measure(work: Callable[[str], object], texts: List[str], threads: int, repeats: int) -> float:
+    """Return the best wall-clock time for processing ``texts`` once per thread."""
+    timings: List[float] = []
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        # Warm up per-thread state (Janome tokenizers) before timing.
+        list(executor.map(lambda _: [work(text) for text in texts[:1]], range(threads)))
+        for _ in range(repeats):
+            start = time.perf_counter()
+            list(executor.map(lambda _: [work(text) for text in texts], range(threads)))
+            timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure fast-bunkai throughput while scaling the number of threads."
+    )
+    parser.add_argument(
+        "--max-threads",
+        type=int,
+        default=min(os.cpu_count() or 1, 8),
+        help="Largest thread count to measure (default: min(cpu_count, 8)).",
+    )
+    parser.add_argument(
+        "--repeats", type=int, default=3, help="Number of repetitions per thread count."
+    )
+    parser.add_argument(
+        "--loops", type=int, default=50, help="How many times each thread loops the corpus."
+    )
+    args = parser.parse_args()
+
+    fast = FastBunkai()
+    texts = list(PASSAGES + load_external_texts()) * args.loops
+    workloads = {
+        "__call__": lambda text: list(fast(text)),
+        "eos": fast.eos,
+    }
+
+    print(f"Python {sys.version.split()[0]} (GIL {'enabled' if gil_enabled() else 'disabled'})")
+    for name, work in workloads.items():
+        print(f"\n{name} ({len(texts)} docs per thread):")
+        baseline = None
+        for threads in range(1, max(args.max_threads, 1) + 1):
+            elapsed = measure(work, texts, threads, args.repeats)
+            throughput = threads * len(texts) / elapsed
+            if baseline is None:
+                baseline = throughput
+            print(
+                f"  threads={threads:<2d} {throughput:10.1f} docs/s"
+                f"  speedup={throughput / baseline:5.2f}x"
+            )
+
+    if gil_enabled():
+        print(
+            "\nNote: the GIL serializes the Python side; "
+            "use a free-threaded interpreter (e.g. python3.13t) to measure parallel scaling."
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,17 @@
-use fast_bunkai_rs::{segment as segment_core, Segmentation};
+use fast_bunkai_rs::{segment as segment_core, Segmentation, Segmenter};
+use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
 use pyo3::types::{PyDict, PyList};
 
-fn segmentation_to_py(py: Python<'_>, output: &Segmentation) -> PyResult<PyObject> {
-    let dict = PyDict::new_bound(py);
-    let layers = PyList::empty_bound(py);
+fn segmentation_to_py<'py>(py: Python<'py>, output: &Segmentation) -> PyResult<Bound<'py, PyDict>> {
+    let dict = PyDict::new(py);
+    let layers = PyList::empty(py);
     for layer in &output.layers {
-        let layer_dict = PyDict::new_bound(py);
+        let layer_dict = PyDict::new(py);
         layer_dict.set_item("name", layer.name)?;
-        let spans_list = PyList::empty_bound(py);
+        let spans_list = PyList::empty(py);
         for span in &layer.spans {
-            let span_dict = PyDict::new_bound(py);
+            let span_dict = PyDict::new(py);
             span_dict.set_item("rule_name", span.rule_name)?;
             span_dict.set_item("start", span.start)?;
             span_dict.set_item("end", span.end)?;
@@ -29,18 +30,44 @@ fn segmentation_to_py(py: Python<'_>, output: &Segmentation) -> PyResult<PyObjec
     }
     dict.set_item("layers", &layers)?;
     dict.set_item("final_boundaries", output.final_boundaries.clone())?;
-    Ok(dict.into_py(py))
+    Ok(dict)
 }
 
 #[allow(clippy::useless_conversion)]
 #[pyfunction]
-fn segment(py: Python<'_>, text: &str) -> PyResult<PyObject> {
+fn segment<'py>(py: Python<'py>, text: &str) -> PyResult<Bound<'py, PyDict>> {
     let output = py.allow_threads(|| segment_core(text));
     segmentation_to_py(py, &output)
 }
 
-#[pymodule]
+/// Segmenter with a compiled user abbreviation automaton.
+#[pyclass(frozen, module = "fast_bunkai._fast_bunkai", name = "Segmenter")]
+struct PySegmenter {
+    inner: Segmenter,
+}
+
+#[allow(clippy::useless_conversion)]
+#[pymethods]
+impl PySegmenter {
+    #[new]
+    #[pyo3(signature = (exceptions = Vec::new()))]
+    fn new(exceptions: Vec<String>) -> PyResult<Self> {
+        let inner = Segmenter::with_exceptions(&exceptions)
+            .map_err(|err| PyValueError::new_err(err.to_string()))?;
+        Ok(Self { inner })
+    }
+
+    fn segment<'py>(&self, py: Python<'py>, text: &str) -> PyResult<Bound<'py, PyDict>> {
+        let output = py.allow_threads(|| self.inner.segment(text));
+        segmentation_to_py(py, &output)
+    }
+}
+
+// The module keeps no Python-visible mutable state and the core crate only uses
+// `Sync` statics, so it is safe to run without the GIL on free-threaded builds.
+#[pymodule(gil_used = false)]
 fn _fast_bunkai(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(segment, m)?)?;
+    m.add_class::<PySegmenter>()?;
     Ok(())
 }
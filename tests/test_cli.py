@@ -1,5 +1,11 @@
+import socket
 import subprocess
 import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
 
 
 def run_cli(args: list[str], text: str) -> subprocess.CompletedProcess[str]:
@@ -9,6 +15,7 @@ def run_cli(args: list[str], text: str) -> subprocess.CompletedProcess[str]:
         text=True,
         capture_output=True,
         check=True,
+        timeout=120,
     )
 
 
@@ -28,3 +35,89 @@ def test_cli_linebreak_placeholder() -> None:
     text = "改行を▁含む文章です。\n"
     result = run_cli([], text)
     assert result.stdout == "改行を▁│含む文章です。\n"
+
+
+def _connect_when_ready(socket_path: Path, server: subprocess.Popen[str]) -> socket.socket:
+    # The socket file appears at bind(), before listen(), so retry until connect succeeds.
+    deadline = time.monotonic() + 30
+    while True:
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            client.connect(str(socket_path))
+            return client
+        except (FileNotFoundError, ConnectionRefusedError):
+            client.close()
+        assert server.poll() is None, server.stderr.read() if server.stderr else ""
+        assert time.monotonic() < deadline, "server did not start"
+        time.sleep(0.05)
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="requires Unix domain sockets")
+def test_cli_serve_and_connect_match_local_output(tmp_path: Path) -> None:
+    socket_path = tmp_path / "fast-bunkai.sock"
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            *("-m", "fast_bunkai.cli", "serve", "--socket", str(socket_path)),
+            *("--workers", "1"),
+        ],
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    idle_clients: list[socket.socket] = []
+    try:
+        # Idle connections beyond --workers must neither stall new clients nor shutdown.
+        for _ in range(3):
+            idle_clients.append(_connect_when_ready(socket_path, server))
+
+        text = "こんにちは。ありがとう。\n改行を▁含む文章です。\n" * 50
+        for args in ([], ["--ma"]):
+            remote = run_cli([*args, "--connect", str(socket_path)], text)
+            assert remote.stdout == run_cli(args, text).stdout
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+        for idle in idle_clients:
+            idle.close()
+    assert not socket_path.exists()
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="requires Unix domain sockets")
+def test_server_closes_idle_connections(tmp_path: Path) -> None:
+    from fast_bunkai.server import SegmentationServer
+
+    server = SegmentationServer(tmp_path / "fast-bunkai.sock", workers=1, idle_timeout=0.2)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(10)
+            client.connect(str(server.socket_path))
+            assert client.recv(1) == b""
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="requires Unix domain sockets")
+def test_server_runs_pipelined_requests_concurrently(tmp_path: Path) -> None:
+    from fast_bunkai.client import request_lines
+    from fast_bunkai.server import SegmentationServer
+
+    class BarrierServer(SegmentationServer):
+        # Each request waits for the other, so this only passes if both run at once.
+        barrier = threading.Barrier(2, timeout=10)
+
+        def handle_payload(self, raw: bytes) -> dict:
+            self.barrier.wait()
+            return super().handle_payload(raw)
+
+    server = BarrierServer(tmp_path / "fast-bunkai.sock", workers=2)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        outputs = list(request_lines(server.socket_path, ["一文目。\n", "二文目。次。\n"]))
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert outputs == ["一文目。\n", "二文目。│次。\n"]
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import gzip
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from fast_bunkai.corpus import MANIFEST_NAME, discover_inputs, iter_documents, process_corpus
+
+TEXT_DOCS = ["こんにちは。ありがとう。\n", "改行を▁含む文章です。\n", "No.1のホテルです。\n"]
+JSONL_DOCS = ["顔文字(*^_^*)だよ。すぐ返信するね。", "一行目です。\n二行目です。"]
+
+
+def _write_inputs(root: Path) -> None:
+    (root / "nested").mkdir(parents=True)
+    (root / "a.txt").write_text("".join(TEXT_DOCS), encoding="utf-8")
+    with gzip.open(root / "nested" / "b.jsonl.gz", "wt", encoding="utf-8") as writer:
+        for doc in JSONL_DOCS:
+            writer.write(json.dumps({"text": doc}, ensure_ascii=False) + "\n")
+    (root / "ignored.csv").write_text("not,a,corpus\n", encoding="utf-8")
+
+
+def _expected_output() -> str:
+    lines = TEXT_DOCS + [doc.replace("\n", "▁") + "\n" for doc in JSONL_DOCS]
+    result = subprocess.run(
+        [sys.executable, "-m", "fast_bunkai.cli"],
+        input="".join(lines),
+        text=True,
+        capture_output=True,
+        check=True,
+    )
+    return result.stdout
+
+
+def _read_shards(output_dir: Path) -> str:
+    return "".join(
+        path.read_text(encoding="utf-8") for path in sorted(output_dir.glob("shard-*.txt"))
+    )
+
+
+def test_process_corpus_matches_cli_and_resumes(tmp_path: Path) -> None:
+    _write_inputs(tmp_path / "in")
+    output_dir = tmp_path / "out"
+    inputs = discover_inputs([str(tmp_path / "in")])
+    assert [path.name for path in inputs] == ["a.txt", "b.jsonl.gz"]
+
+    stats = process_corpus(inputs, output_dir, workers=2, docs_per_shard=2, progress=False)
+    assert (stats.shards, stats.documents) == (3, 5)
+    assert _read_shards(output_dir) == _expected_output()
+
+    # Forget one finished shard as if the job had been interrupted before it completed.
+    manifest_path = output_dir / MANIFEST_NAME
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    del manifest["inputs"]["a.txt"]["done"]["1"]
+    manifest_path.write_text(json.dumps(manifest), encoding="utf-8")
+    (output_dir / "shard-00000-00001.txt").unlink()
+
+    resumed = process_corpus(inputs, output_dir, workers=2, docs_per_shard=2, progress=False)
+    assert (resumed.shards, resumed.documents) == (1, 1)
+    assert _read_shards(output_dir) == _expected_output()
+
+    again = process_corpus(inputs, output_dir, workers=2, docs_per_shard=2, progress=False)
+    assert again.shards == 0
+
+
+def test_resume_survives_moving_inputs(tmp_path: Path) -> None:
+    _write_inputs(tmp_path / "in")
+    output_dir = tmp_path / "out"
+    first = process_corpus(
+        discover_inputs([str(tmp_path / "in")]), output_dir, workers=1, progress=False
+    )
+    assert first.shards == 2
+
+    moved = tmp_path / "moved"
+    (tmp_path / "in").rename(moved)
+    again = process_corpus(discover_inputs([str(moved)]), output_dir, workers=1, progress=False)
+    assert again.shards == 0
+    assert sorted(path.name for path in output_dir.glob("shard-*.txt")) == [
+        "shard-00000-00000.txt",
+        "shard-00001-00000.txt",
+    ]
+
+
+def test_resume_rejects_different_or_modified_inputs(tmp_path: Path) -> None:
+    _write_inputs(tmp_path / "in")
+    output_dir = tmp_path / "out"
+    process_corpus(
+        discover_inputs([str(tmp_path / "in" / "nested")]), output_dir, workers=1, progress=False
+    )
+
+    # A wider input set moves the common root and would re-key, and so duplicate, every input.
+    with pytest.raises(ValueError, match="different inputs"):
+        process_corpus(
+            discover_inputs([str(tmp_path / "in")]), output_dir, workers=1, progress=False
+        )
+
+    (tmp_path / "in" / "nested" / "b.jsonl.gz").write_bytes(gzip.compress(b'{"text": "x"}\n'))
+    with pytest.raises(ValueError, match="changed since"):
+        process_corpus(
+            discover_inputs([str(tmp_path / "in" / "nested")]),
+            output_dir,
+            workers=1,
+            progress=False,
+        )
+
+
+def test_output_dir_inside_inputs_is_not_read_back(tmp_path: Path) -> None:
+    _write_inputs(tmp_path / "in")
+    output_dir = tmp_path / "in" / "out"
+    for _ in range(3):
+        process_corpus(
+            discover_inputs([str(tmp_path / "in")]), output_dir, workers=1, progress=False
+        )
+    manifest = json.loads((output_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+    assert sorted(manifest["inputs"]) == ["a.txt", "nested/b.jsonl.gz"]
+    assert _read_shards(output_dir) == _expected_output()
+
+
+@pytest.mark.parametrize(
+    ("line", "message"),
+    [
+        ('{"text": null}', "field 'text' must be a string, got NoneType"),
+        ("[1]", "expected a JSON object, got list"),
+        ('{"text": "unterminated', "invalid JSON"),
+        ('{"body": "x"}', "missing field 'text'"),
+    ],
+)
+def test_malformed_jsonl_rows_name_file_and_line(tmp_path: Path, line: str, message: str) -> None:
+    path = tmp_path / "docs.jsonl"
+    path.write_text('{"text": "ok"}\n\n' + line + "\n", encoding="utf-8")
+    with pytest.raises(ValueError, match=f"docs.jsonl:3: {message}"):
+        list(iter_documents(path))
+
+
+def test_cli_corpus_subcommand(tmp_path: Path) -> None:
+    _write_inputs(tmp_path / "in")
+    output_dir = tmp_path / "out"
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "fast_bunkai.cli",
+            "corpus",
+            str(tmp_path / "in" / "**" / "*.jsonl.gz"),
+            str(tmp_path / "in" / "a.txt"),
+            "--output-dir",
+            str(output_dir),
+            "--workers",
+            "2",
+        ],
+        text=True,
+        capture_output=True,
+        check=True,
+    )
+    assert "docs/s" in result.stderr
+    assert "MB/s" in result.stderr
+    shards = sorted(output_dir.glob("shard-*.txt"))
+    assert len(shards) == 2
+    assert "".join(path.read_text(encoding="utf-8") for path in shards)
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import pickle
+
+import pytest
+from bunkai import Bunkai
+
+from fast_bunkai import FastBunkai
+
+TEXT = "Mr. Smith met Dr. Who in the U.S. today. See Fig. 3, e.g. the chart. 本日は晴天なり。"
+ABBREVIATIONS = ["Mr.", "Dr.", "U.S.", "Fig.", "e.g."]
+
+
+def test_user_exceptions_merge_abbreviation_splits() -> None:
+    fast = FastBunkai(exceptions=ABBREVIATIONS)
+
+    assert list(fast(TEXT)) == [
+        "Mr. Smith met Dr. Who in the U.S. today. ",
+        "See Fig. 3, e.g. the chart. ",
+        "本日は晴天なり。",
+    ]
+    assert "UserExceptionAnnotator" in fast.eos(TEXT).available_layers()
+
+
+def test_empty_exceptions_stay_bunkai_compatible() -> None:
+    fast = FastBunkai(exceptions=[])
+    ref = Bunkai()
+
+    assert list(fast(TEXT)) == list(ref(TEXT))
+    assert sorted(fast.eos(TEXT).available_layers()) == sorted(ref.eos(TEXT).available_layers())
+
+
+def test_exceptions_require_word_boundary() -> None:
+    text = "Hmr. Next sentence."
+    assert list(FastBunkai(exceptions=["mr."])(text)) == list(FastBunkai()(text))
+
+
+def test_exceptions_survive_pickling() -> None:
+    fast = pickle.loads(pickle.dumps(FastBunkai(exceptions=ABBREVIATIONS)))
+    assert len(list(fast(TEXT))) == 3
+
+
+def test_exceptions_reject_single_string() -> None:
+    with pytest.raises(TypeError):
+        FastBunkai(exceptions="Mr.")
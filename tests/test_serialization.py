@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import pickle
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from fast_bunkai import FastBunkai, _fast_bunkai
+from fast_bunkai.annotations import SpanAnnotation
+from fast_bunkai.serialization import (
+    RULES,
+    pack_segmentation,
+    unpack_annotations,
+    unpack_boundaries,
+    unpack_segmentation,
+)
+
+TEXTS = [
+    "",
+    "こんにちは。ありがとう。",
+    "顔文字(*^_^*)だよ。やったー(嬉)！わーい…！",
+    "速報🚀✨Python3.13が来た！Rustも追随予定！",
+    "スタッフ? と話し込み\n次の行です。",
+    "ROOM No.411でした。メールはtest@example.comです。",
+    *(
+        path.read_text(encoding="utf-8")
+        for path in sorted(Path(__file__).parent.glob("data/texts/*.txt"))
+    ),
+]
+
+
+def _split_in_worker(splitter: FastBunkai, text: str) -> List[str]:
+    return list(splitter(text))
+
+
+def test_splitter_is_picklable_after_use() -> None:
+    fast = FastBunkai()
+    fast.eos(TEXTS[1])  # populate the thread-local tokenizer
+
+    restored = pickle.loads(pickle.dumps(fast))
+
+    assert len(pickle.dumps(fast)) < 200
+    for text in TEXTS:
+        assert list(restored(text)) == list(fast(text))
+    assert restored.eos(TEXTS[2]).get_final_layer() == fast.eos(TEXTS[2]).get_final_layer()
+
+
+def test_splitter_can_be_sent_to_process_pool() -> None:
+    fast = FastBunkai()
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        results = list(executor.map(_split_in_worker, [fast] * len(TEXTS), TEXTS))
+    assert results == [list(fast(text)) for text in TEXTS]
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_packed_segmentation_round_trip(text: str) -> None:
+    fast = FastBunkai()
+    result = _fast_bunkai.segment(text)
+    packed = pack_segmentation(result)
+
+    assert unpack_segmentation(packed, text) == result
+    assert unpack_boundaries(fast.segment_packed(text)) == fast.find_eos(text)
+
+    def by_position(spans: List[SpanAnnotation]) -> List[SpanAnnotation]:
+        return sorted(spans, key=lambda span: (span.start_index, span.end_index))
+
+    annotations = unpack_annotations(packed, text)
+    expected = fast.eos(text)
+    assert by_position(annotations.get_final_layer()) == by_position(expected.get_final_layer())
+    assert len(packed) < len(pickle.dumps(expected))
+
+
+def test_unpack_rejects_foreign_data() -> None:
+    with pytest.raises(ValueError):
+        unpack_segmentation(b"not packed data", "")
+    with pytest.raises(ValueError):
+        unpack_boundaries(FastBunkai().segment_packed("文です。")[:-2])
+
+
+def _patch_uint32(data: bytes, index: int, value: int) -> bytes:
+    patched = bytearray(data)
+    struct.pack_into("<I", patched, 4 * index, value)
+    return bytes(patched)
+
+
+def test_unpack_rejects_unknown_rule_ids() -> None:
+    text = "文です。"
+    packed = FastBunkai().segment_packed(text)
+    _, n_layers, n_spans, _ = struct.unpack_from("<4sIII", packed)
+    assert n_spans > 0
+    layer_table, span_table = 4, 4 + 2 * n_layers
+
+    with pytest.raises(ValueError, match="unknown rule id"):
+        unpack_segmentation(_patch_uint32(packed, layer_table, len(RULES)), text)
+    with pytest.raises(ValueError, match="unknown rule id"):
+        unpack_segmentation(_patch_uint32(packed, span_table + 2, 2**32 - 1), text)
+    with pytest.raises(ValueError, match="span counts"):
+        unpack_segmentation(_patch_uint32(packed, layer_table + 1, n_spans + 1), text)
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import pytest
+
+from fast_bunkai import FastBunkai
+
+THREADS = 8
+ROUNDS = 2
+
+
+def _load_texts() -> List[str]:
+    # Many short documents make threads interleave far more often than a few long ones.
+    data_dir = Path(__file__).parent / "data" / "texts"
+    lines = [
+        line + "\n"
+        for path in sorted(data_dir.glob("*.txt"))
+        for line in path.read_text(encoding="utf-8").splitlines()
+        if line.strip()
+    ]
+    return lines[:40]
+
+
+def _eos_summary(fast: FastBunkai, text: str) -> object:
+    annotations = fast.eos(text)
+    boundaries = sorted({span.end_index for span in annotations.get_final_layer()})
+    surfaces = [
+        span.args["token"].word_surface
+        for span in annotations.get_annotation_layer("MorphAnnotatorJanome")
+        if span.args is not None and "token" in span.args
+    ]
+    return boundaries, surfaces
+
+
+@pytest.mark.parametrize("method", ["__call__", "find_eos", "eos"])
+def test_concurrent_results_match_single_thread(method: str) -> None:
+    fast = FastBunkai()
+    texts = _load_texts()
+    workloads: Dict[str, Callable[[str], object]] = {
+        "__call__": lambda text: list(fast(text)),
+        "find_eos": fast.find_eos,
+        "eos": lambda text: _eos_summary(fast, text),
+    }
+    work = workloads[method]
+    expected = [work(text) for text in texts]
+
+    # Release all threads at once so that they hit the splitter concurrently.
+    barrier = threading.Barrier(THREADS)
+
+    def run(offset: int) -> List[object]:
+        barrier.wait()
+        results: List[object] = [None] * len(texts)
+        for step in range(ROUNDS * len(texts)):
+            idx = (offset + step) % len(texts)
+            results[idx] = work(texts[idx])
+        return results
+
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        # result() re-raises any exception from a worker thread.
+        outputs = [future.result() for future in [executor.submit(run, i) for i in range(THREADS)]]
+
+    assert all(output == expected for output in outputs)
+
+
+def test_each_thread_owns_its_janome_matcher() -> None:
+    # Janome's fst.Matcher updates its prefix cache without holding its lock, so a
+    # Matcher reached from several threads can raise KeyError on free-threaded builds.
+    fast = FastBunkai()
+    tokenizers: List[object] = []
+    threads = [
+        threading.Thread(target=lambda: tokenizers.append(fast._get_tokenizer()))
+        for _ in range(THREADS)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(tokenizer) for tokenizer in tokenizers}) == THREADS
+    assert len({id(getattr(tokenizer, "matcher")) for tokenizer in tokenizers}) == THREADS